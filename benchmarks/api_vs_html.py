@@ -0,0 +1,89 @@
+"""HTML routes aur /api/v1 JSON API ka payload size aur latency compare karta hai.
+
+Temporary SQLite database mein sample data daal kar Flask test client se dono
+taraf ke pages maangta hai:
+
+    python benchmarks/api_vs_html.py --animes 200 --episodes 12 --runs 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import suzuani.monkey_patch  # noqa: F401
+from suzuani import create_app, db
+from suzuani.config import Config
+from suzuani.models import (Anime, Category, Episode, Manga, MangaChapter,
+                            MangaPage, MusicCategory, Song, User)
+
+PAIRS = [
+    ('anime shelves', '/', '/api/v1/shelves/anime'),
+    ('manga shelves', '/mangas', '/api/v1/shelves/manga'),
+    ('music shelves', '/music', '/api/v1/shelves/music'),
+    ('anime detail', '/anime/1', '/api/v1/anime/1'),
+    ('manga detail', '/manga/1', '/api/v1/manga/1'),
+    ('chapter', '/manga/1/read/1', '/api/v1/manga/1/chapters/1'),
+]
+
+def seed(animes, episodes):
+    categories = [Category(name=f'Category {i}') for i in range(5)]
+    music_categories = [MusicCategory(name=f'Music {i}') for i in range(3)]
+    db.session.add_all(categories + music_categories)
+    for i in range(animes):
+        anime = Anime(title=f'Anime {i}', description='Lorem ipsum dolor sit amet. ' * 20, release_year=2000 + i % 25,
+                      poster_url=f'uploads/posters/anime_{i}.jpg', category=categories[i % len(categories)])
+        anime.episodes = [Episode(title=f'Episode {n}', thumbnail_url=f'uploads/episodes/{i}_{n}.jpg',
+                                  watch_link=f'https://www.youtube.com/watch?v=a{i}e{n}') for n in range(episodes)]
+        manga = Manga(title=f'Manga {i}', description='Lorem ipsum dolor sit amet. ' * 20, release_year=2000 + i % 25,
+                      poster_url=f'uploads/posters/manga_{i}.jpg', category=categories[i % len(categories)])
+        manga.chapters = [MangaChapter(title=f'Chapter {n}', pages=[MangaPage(page_number=p, image_url=f'uploads/manga_pages/{i}_{n}_{p}.jpg') for p in range(20)])
+                          for n in range(episodes)]
+        db.session.add_all([anime, manga])
+    for i in range(animes // 2):
+        db.session.add(Song(title=f'Song {i}', artist=f'Artist {i % 7}', cover_url=f'uploads/covers/{i}.jpg',
+                            song_url=f'uploads/songs/{i}.mp3', category=music_categories[i % len(music_categories)]))
+    db.session.commit()
+
+def measure(client, url, runs, headers=None):
+    response = client.get(url, headers=headers)
+    assert response.status_code in (200, 304), f'{url} -> {response.status_code}'
+    started = time.perf_counter()
+    for _ in range(runs):
+        client.get(url, headers=headers)
+    return len(response.get_data()), (time.perf_counter() - started) / runs * 1000, response.headers.get('ETag')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animes', type=int, default=100)
+    parser.add_argument('--episodes', type=int, default=12)
+    parser.add_argument('--runs', type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            seed(args.animes, args.episodes)
+            admin_id = User.query.filter_by(username='admin').first().id
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session['_user_id'] = str(admin_id)
+            session['_fresh'] = True
+
+        print(f"{'page':<15}{'html B':>10}{'html ms':>9}{'json B':>10}{'gzip B':>9}{'br B':>9}{'json ms':>9}{'304 ms':>8}")
+        for name, html_url, api_url in PAIRS:
+            html_size, html_ms, _ = measure(client, html_url, args.runs)
+            json_size, json_ms, etag = measure(client, api_url, args.runs)
+            gzip_size, _, _ = measure(client, api_url, 1, {'Accept-Encoding': 'gzip'})
+            br_size, _, _ = measure(client, api_url, 1, {'Accept-Encoding': 'br'})
+            _, not_modified_ms, _ = measure(client, api_url, args.runs, {'If-None-Match': etag})
+            print(f'{name:<15}{html_size:>10}{html_ms:>9.2f}{json_size:>10}{gzip_size:>9}{br_size:>9}{json_ms:>9.2f}{not_modified_ms:>8.2f}')
+
+if __name__ == '__main__':
+    main()
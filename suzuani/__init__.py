@@ -15,6 +15,7 @@ bcrypt = Bcrypt()
 login_manager = LoginManager()
 login_manager.login_view = 'main.login'
 login_manager.login_message_category = 'info'
+login_manager.blueprint_login_views = {'api': None}  # API par login page redirect ki jagah 401
 mail = Mail()
 admin = Admin(name='SuzuAni Admin', template_mode='bootstrap3', base_template='admin/master.html')
 
@@ -63,9 +64,11 @@ def create_app(config_class=Config):
             playlist_json = "[]"
         return dict(get_embed_url=get_embed_url, playlist_json=playlist_json)
 
-    from suzuani.models import User, Category, Anime, Episode, Manga, MangaChapter, MangaPage, Banner, Comment, MusicCategory
+    from suzuani.models import User, Category, Anime, Episode, Manga, MangaChapter, MangaPage, Banner, Comment, MusicCategory, upgrade_schema
     from suzuani.routes import main as main_blueprint
     app.register_blueprint(main_blueprint)
+    from suzuani.api import api as api_blueprint
+    app.register_blueprint(api_blueprint)
 
     from suzuani.admin_panel import (SecureModelView, UserAdminView, AnimeAdminView, MangaAdminView, EpisodeAdminView, MangaChapterAdminView, MangaPageAdminView, BannerAdminView, MusicCategoryAdminView, SongAdminView)
     
@@ -83,6 +86,7 @@ def create_app(config_class=Config):
     
     with app.app_context():
         db.create_all()
+        upgrade_schema()
         if not User.query.filter_by(username='admin').first():
             hashed_password = bcrypt.generate_password_hash('admin123').decode('utf-8')
             admin_user = User(username='admin', email='admin@suzuani.com', password=hashed_password, is_admin=True, is_verified=True)
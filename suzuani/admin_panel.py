@@ -1,14 +1,21 @@
 import os.path as op
-from flask import redirect, request, url_for
+from flask import current_app, redirect, request, url_for
 from flask_admin.contrib.sqla import ModelView
 from flask_admin.form.upload import FileUploadField, ImageUploadField
 from flask_admin.form.fields import Select2Field
 from flask_login import current_user
-from wtforms.validators import DataRequired
+from werkzeug.datastructures import FileStorage
+from wtforms.validators import DataRequired, NumberRange
+from suzuani.banners import banner_service
+from suzuani.utils import delete_banner_variants, save_banner_variants
 
 base_path = op.join(op.dirname(__file__), 'static')
 
 class SecureModelView(ModelView):
+    # version_id SQLAlchemy khud badhata hai (API ETags ke liye), admin form se edit nahi hona chahiye.
+    column_exclude_list = ['version_id']
+    form_excluded_columns = ['version_id']
+
     def is_accessible(self):
         return current_user.is_authenticated and current_user.is_admin
 
@@ -76,15 +83,34 @@ class BannerAdminView(SecureModelView):
             'label': 'Banner Type',
             'choices': [('anime', 'Anime'), ('manga', 'Manga'), ('music', 'Music')],
             'validators': [DataRequired()]
-        }
+        },
+        'weight': {'validators': [NumberRange(min=0)]}
     }
-    column_list = ('banner_type', 'anime', 'manga')
-    form_columns = ('banner_type', 'image_url', 'anime', 'manga')
+    column_list = ('banner_type', 'anime', 'manga', 'weight', 'starts_at', 'ends_at')
+    form_columns = ('banner_type', 'image_url', 'anime', 'manga', 'weight', 'starts_at', 'ends_at')
     form_widget_args = {
         'anime': {'description': 'Agar banner type "Anime" hai to hi ise select karein.'},
-        'manga': {'description': 'Agar banner type "Manga" hai to hi ise select karein.'}
+        'manga': {'description': 'Agar banner type "Manga" hai to hi ise select karein.'},
+        'weight': {'description': 'Zyada weight wala banner zyada baar dikhega. 0 rakhne par banner band ho jayega.'},
+        'starts_at': {'description': 'Khali chhodne par banner turant dikhega.'},
+        'ends_at': {'description': 'Khali chhodne par banner hamesha dikhega.'}
     }
 
+    def after_model_change(self, form, model, is_created):
+        # Sirf nayi upload par crops banao; same naam ki file overwrite ho to purane crops bhi badalne chahiye.
+        upload = form.image_url.data
+        if isinstance(upload, FileStorage) and upload.filename:
+            try:
+                save_banner_variants(model.image_url)
+            except Exception:
+                # Row save ho chuka hai; crops na ban sakein to purane hata do taaki page original image dikhaye.
+                current_app.logger.exception('Banner variants could not be generated for %s', model.image_url)
+                delete_banner_variants(model.image_url)
+        banner_service.invalidate()
+
+    def after_model_delete(self, model):
+        banner_service.invalidate(model.banner_type)
+
 class MusicCategoryAdminView(SecureModelView):
     form_columns = ['name']
     column_searchable_list = ['name']
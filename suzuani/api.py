@@ -0,0 +1,208 @@
+import gzip
+import hashlib
+
+import brotli
+import orjson
+from flask import Blueprint, Response, abort, request, url_for
+from flask_login import login_required
+from werkzeug.exceptions import HTTPException
+from suzuani import db
+from suzuani.models import (Anime, Category, Episode, Manga, MangaChapter,
+                            MangaPage, MusicCategory, Song)
+
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Isse chhote responses ko compress karne ka fayda nahi, CPU zyada lagta hai.
+COMPRESS_MIN_SIZE = 512
+
+# Har resource type ke woh fields jo ?fields[<type>]=a,b se maange ja sakte hain ('id' hamesha aata hai).
+FIELDS = {
+    'category': ('name',),
+    'anime': ('title', 'description', 'poster_url', 'rating', 'release_year', 'views', 'category_id'),
+    'episode': ('title', 'thumbnail_url', 'watch_link'),
+    'manga': ('title', 'description', 'poster_url', 'rating', 'release_year', 'views', 'category_id'),
+    'chapter': ('title', 'manga_id'),
+    'page': ('page_number', 'image_url'),
+    'music_category': ('name',),
+    'song': ('title', 'artist', 'cover_url', 'song_url', 'music_category_id'),
+}
+STATIC_FIELDS = {'poster_url', 'thumbnail_url', 'image_url', 'cover_url', 'song_url'}
+
+def _fieldset(kind):
+    raw = request.args.get(f'fields[{kind}]')
+    if raw is None: return FIELDS[kind]
+    fields = tuple(name for name in raw.split(',') if name)
+    unknown = set(fields) - set(FIELDS[kind])
+    if unknown:
+        abort(400, description=f"Unknown fields for '{kind}': {', '.join(sorted(unknown))}")
+    return fields
+
+def _serialize(obj, fields):
+    data = {'id': obj.id}
+    for name in fields:
+        value = getattr(obj, name)
+        data[name] = url_for('static', filename=value) if name in STATIC_FIELDS and value else value
+    return data
+
+def _version_rows(model, *criteria):
+    return db.session.query(model.id, model.version_id).filter(*criteria).order_by(model.id).all()
+
+def _shelf_version_rows(model, group_column, limit):
+    # Sirf wahi rows jo shelf mein jaati hain: har group ke pehle `limit` rows, build() jaisa order_by(id).
+    rank = db.func.row_number().over(partition_by=group_column, order_by=model.id).label('rank')
+    ranked = db.session.query(model.id, model.version_id, rank).subquery()
+    return db.session.query(ranked.c.id, ranked.c.version_id).filter(ranked.c.rank <= limit).order_by(ranked.c.id).all()
+
+def _weak_etag(*row_sets):
+    digest = hashlib.sha1()
+    for rows in row_sets:
+        for row_id, version_id in rows:
+            digest.update(f'{row_id}:{version_id};'.encode())
+        digest.update(b'|')
+    return digest.hexdigest()
+
+def _json_response(payload, status=200):
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def _conditional_response(row_sets, build_payload):
+    # ETag sirf (id, version_id) columns se banta hai, isliye client ke paas fresh copy ho
+    # to 304 bina payload banaye bhej dete hain.
+    etag = _weak_etag(*row_sets)
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = _json_response(build_payload())
+    response.set_etag(etag, weak=True)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+@api.errorhandler(HTTPException)
+def api_error(error):
+    return _json_response({'error': {'status': error.code, 'message': error.description}}, status=error.code)
+
+# Blueprint handler sirf match hue routes par chalta hai; galat /api/v1 URL ko bhi JSON error mile.
+@api.app_errorhandler(404)
+@api.app_errorhandler(405)
+def api_routing_error(error):
+    if request.path.startswith(api.url_prefix): return api_error(error)
+    return error
+
+@api.after_request
+def compress_response(response):
+    if response.direct_passthrough or 'Content-Encoding' in response.headers: return response
+    response.vary.add('Accept-Encoding')
+    if response.status_code != 200 or (response.content_length or 0) < COMPRESS_MIN_SIZE: return response
+    encoding = request.accept_encodings.best_match(['br', 'gzip'])
+    if encoding == 'br':
+        response.set_data(brotli.compress(response.get_data(), quality=5))
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(response.get_data(), compresslevel=6))
+    else:
+        return response
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+@api.route("/shelves/anime")
+@login_required
+def anime_shelves():
+    category_fields, anime_fields = _fieldset('category'), _fieldset('anime')
+    def build():
+        shelves = []
+        for cat in Category.query.order_by(Category.id).all():
+            shelf = _serialize(cat, category_fields)
+            shelf['animes'] = [_serialize(anime, anime_fields) for anime in Anime.query.filter_by(category=cat).order_by(Anime.id).limit(10).all()]
+            shelves.append(shelf)
+        return {'shelves': shelves}
+    return _conditional_response([_version_rows(Category), _shelf_version_rows(Anime, Anime.category_id, 10)], build)
+
+@api.route("/shelves/manga")
+@login_required
+def manga_shelves():
+    category_fields, manga_fields = _fieldset('category'), _fieldset('manga')
+    def build():
+        shelves = []
+        for cat in Category.query.order_by(Category.id).all():
+            shelf = _serialize(cat, category_fields)
+            shelf['mangas'] = [_serialize(manga, manga_fields) for manga in Manga.query.filter_by(category=cat).order_by(Manga.id).limit(10).all()]
+            shelves.append(shelf)
+        return {'shelves': shelves}
+    return _conditional_response([_version_rows(Category), _shelf_version_rows(Manga, Manga.category_id, 10)], build)
+
+@api.route("/shelves/music")
+@login_required
+def music_shelves():
+    category_fields, song_fields = _fieldset('music_category'), _fieldset('song')
+    def build():
+        shelves = []
+        for cat in MusicCategory.query.order_by(MusicCategory.id).all():
+            shelf = _serialize(cat, category_fields)
+            shelf['songs'] = [_serialize(song, song_fields) for song in Song.query.filter_by(category=cat).order_by(Song.id).limit(15).all()]
+            shelves.append(shelf)
+        return {'shelves': shelves}
+    return _conditional_response([_version_rows(MusicCategory), _shelf_version_rows(Song, Song.music_category_id, 15)], build)
+
+@api.route("/anime/<int:anime_id>")
+@login_required
+def anime_detail(anime_id):
+    anime_fields, episode_fields = _fieldset('anime'), _fieldset('episode')
+    anime_rows = _version_rows(Anime, Anime.id == anime_id)
+    if not anime_rows: abort(404, description='Anime not found.')
+    def build():
+        anime = Anime.query.get_or_404(anime_id)
+        episodes = Episode.query.filter_by(anime_id=anime_id).order_by(Episode.id).all()
+        return {'anime': _serialize(anime, anime_fields), 'episodes': [_serialize(episode, episode_fields) for episode in episodes]}
+    return _conditional_response([anime_rows, _version_rows(Episode, Episode.anime_id == anime_id)], build)
+
+@api.route("/anime/<int:anime_id>/episodes")
+@login_required
+def anime_episodes(anime_id):
+    episode_fields = _fieldset('episode')
+    if not _version_rows(Anime, Anime.id == anime_id): abort(404, description='Anime not found.')
+    def build():
+        episodes = Episode.query.filter_by(anime_id=anime_id).order_by(Episode.id).all()
+        return {'episodes': [_serialize(episode, episode_fields) for episode in episodes]}
+    return _conditional_response([_version_rows(Episode, Episode.anime_id == anime_id)], build)
+
+@api.route("/manga/<int:manga_id>")
+@login_required
+def manga_detail(manga_id):
+    manga_fields, chapter_fields = _fieldset('manga'), _fieldset('chapter')
+    manga_rows = _version_rows(Manga, Manga.id == manga_id)
+    if not manga_rows: abort(404, description='Manga not found.')
+    def build():
+        manga = Manga.query.get_or_404(manga_id)
+        chapters = MangaChapter.query.filter_by(manga_id=manga_id).order_by(MangaChapter.id).all()
+        return {'manga': _serialize(manga, manga_fields), 'chapters': [_serialize(chapter, chapter_fields) for chapter in chapters]}
+    return _conditional_response([manga_rows, _version_rows(MangaChapter, MangaChapter.manga_id == manga_id)], build)
+
+@api.route("/manga/<int:manga_id>/chapters")
+@login_required
+def manga_chapters(manga_id):
+    chapter_fields = _fieldset('chapter')
+    if not _version_rows(Manga, Manga.id == manga_id): abort(404, description='Manga not found.')
+    def build():
+        chapters = MangaChapter.query.filter_by(manga_id=manga_id).order_by(MangaChapter.id).all()
+        return {'chapters': [_serialize(chapter, chapter_fields) for chapter in chapters]}
+    return _conditional_response([_version_rows(MangaChapter, MangaChapter.manga_id == manga_id)], build)
+
+@api.route("/manga/<int:manga_id>/chapters/<int:chapter_id>")
+@login_required
+def chapter_detail(manga_id, chapter_id):
+    chapter_fields, page_fields = _fieldset('chapter'), _fieldset('page')
+    chapter_rows = _version_rows(MangaChapter, MangaChapter.id == chapter_id, MangaChapter.manga_id == manga_id)
+    if not chapter_rows: abort(404, description='Chapter not found.')
+    def build():
+        chapter = MangaChapter.query.get_or_404(chapter_id)
+        return {'chapter': _serialize(chapter, chapter_fields), 'pages': [_serialize(page, page_fields) for page in chapter.pages]}
+    return _conditional_response([chapter_rows, _version_rows(MangaPage, MangaPage.chapter_id == chapter_id)], build)
+
+@api.route("/songs/<int:song_id>")
+@login_required
+def song_detail(song_id):
+    song_fields = _fieldset('song')
+    song_rows = _version_rows(Song, Song.id == song_id)
+    if not song_rows: abort(404, description='Song not found.')
+    def build():
+        return {'song': _serialize(Song.query.get_or_404(song_id), song_fields)}
+    return _conditional_response([song_rows], build)
@@ -0,0 +1,77 @@
+import os
+import random
+import threading
+from collections import namedtuple
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy.orm import joinedload
+from suzuani import db
+from suzuani.models import Banner
+from suzuani.utils import banner_variant_path
+
+BannerSlide = namedtuple('BannerSlide', 'id image_url anime_id manga_id title weight variants')
+
+class BannerService:
+    """Har banner type ka active set memory mein rakhta hai aur har request par weighted rotation deta hai.
+
+    Set TTL khatam hone, agle schedule boundary (starts_at/ends_at) aane, ya kisi bhi worker mein admin
+    ke banner add/edit/delete karne (shared marker badalne) par hi database se dobara load hota hai.
+    """
+
+    def __init__(self, slots=4):
+        self.slots = slots
+        self._sets = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, banner_type=None):
+        with self._lock:
+            if banner_type is None:
+                self._sets.clear()
+            else:
+                self._sets.pop(banner_type, None)
+
+    def active(self, banner_type):
+        now = datetime.now()
+        marker = self._marker(banner_type)
+        entry = self._sets.get(banner_type)
+        if entry is None or entry[0] <= now or entry[1] != marker:
+            with self._lock:
+                entry = self._sets.get(banner_type)
+                if entry is None or entry[0] <= now or entry[1] != marker:
+                    expires_at, slides = self._load(banner_type, now)
+                    entry = self._sets[banner_type] = (expires_at, marker, slides)
+        return entry[2]
+
+    def rotation(self, banner_type):
+        # Weighted sampling bina replacement ke (Efraimidis-Spirakis): zyada weight wale banner aage aate hain.
+        slides = self.active(banner_type)
+        ranked = sorted(slides, key=lambda slide: random.random() ** (1.0 / slide.weight), reverse=True)
+        return ranked[:self.slots]
+
+    def _marker(self, banner_type):
+        # Ek chhoti aggregate query: database sab workers mein shared hai, isliye admin ka koi bhi change isse badal deta hai.
+        return tuple(db.session.query(db.func.count(Banner.id), db.func.max(Banner.id), db.func.max(Banner.updated_at))
+                     .filter_by(banner_type=banner_type).one())
+
+    def _load(self, banner_type, now):
+        expires_at = now + timedelta(seconds=current_app.config['BANNER_CACHE_TTL'])
+        static_path = os.path.join(current_app.root_path, 'static')
+        banners = (Banner.query.filter_by(banner_type=banner_type)
+                   .options(joinedload(Banner.anime), joinedload(Banner.manga))
+                   .order_by(Banner.id).all())
+        slides = []
+        for banner in banners:
+            if banner.starts_at and banner.starts_at > now:
+                expires_at = min(expires_at, banner.starts_at)
+                continue
+            if banner.ends_at and banner.ends_at <= now: continue
+            if banner.ends_at: expires_at = min(expires_at, banner.ends_at)
+            if banner.weight <= 0: continue
+            linked = banner.anime or banner.manga
+            variants = tuple((width, banner_variant_path(banner.image_url, width)) for width, _ in current_app.config['BANNER_SIZES']
+                             if os.path.exists(os.path.join(static_path, banner_variant_path(banner.image_url, width))))
+            slides.append(BannerSlide(banner.id, banner.image_url, banner.anime_id, banner.manga_id,
+                                      linked.title if linked else None, banner.weight, variants))
+        return expires_at, tuple(slides)
+
+banner_service = BannerService()
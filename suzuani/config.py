@@ -4,6 +4,11 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'a-very-secret-key-that-you-should-change'
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///../instance/suzuani.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Banner set kitni der (seconds) memory mein rahe; admin changes har worker mein agli request par hi dikh jaate hain.
+    BANNER_CACHE_TTL = int(os.environ.get('BANNER_CACHE_TTL') or 300)
+    # Banner upload par in (width, height) sizes ke WebP crops bante hain (h-48 / md:h-64 slider ke hisaab se).
+    BANNER_SIZES = [(640, 200), (1024, 320), (1600, 500)]
     
     # Flask-Mail Settings
     MAIL_SERVER = 'smtp.googlemail.com'
@@ -1,6 +1,7 @@
 from flask import current_app
 from flask_login import UserMixin
 from itsdangerous import URLSafeTimedSerializer as Serializer
+from sqlalchemy import inspect
 from suzuani import db, login_manager
 from datetime import datetime
 
@@ -49,6 +50,8 @@ class Category(db.Model):
     name = db.Column(db.String(50), unique=True, nullable=False)
     animes = db.relationship('Anime', backref='category', lazy=True)
     mangas = db.relationship('Manga', backref='category', lazy=True)
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
     def __repr__(self): return self.name
 
 class Anime(db.Model):
@@ -62,6 +65,8 @@ class Anime(db.Model):
     category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
     episodes = db.relationship('Episode', backref='anime', lazy=True, cascade="all, delete-orphan")
     comments = db.relationship('Comment', backref='anime', lazy=True, cascade="all, delete-orphan")
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
 
 class Episode(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -69,6 +74,8 @@ class Episode(db.Model):
     thumbnail_url = db.Column(db.String(100), nullable=False, default='default_thumb.jpg')
     watch_link = db.Column(db.String(200), nullable=False)
     anime_id = db.Column(db.Integer, db.ForeignKey('anime.id'), nullable=False)
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
 
 class Manga(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -81,18 +88,24 @@ class Manga(db.Model):
     category_id = db.Column(db.Integer, db.ForeignKey('category.id'), nullable=False)
     chapters = db.relationship('MangaChapter', backref='manga', lazy=True, cascade="all, delete-orphan")
     comments = db.relationship('Comment', backref='manga', lazy=True, cascade="all, delete-orphan")
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
 
 class MangaChapter(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     manga_id = db.Column(db.Integer, db.ForeignKey('manga.id'), nullable=False)
     pages = db.relationship('MangaPage', backref='chapter', lazy=True, cascade="all, delete-orphan", order_by="MangaPage.page_number")
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
 
 class MangaPage(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     page_number = db.Column(db.Integer, nullable=False)
     image_url = db.Column(db.String(100), nullable=False)
     chapter_id = db.Column(db.Integer, db.ForeignKey('manga_chapter.id'), nullable=False)
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
 
 class Banner(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -100,6 +113,10 @@ class Banner(db.Model):
     banner_type = db.Column(db.String(10), nullable=False)
     anime_id = db.Column(db.Integer, db.ForeignKey('anime.id'), nullable=True)
     manga_id = db.Column(db.Integer, db.ForeignKey('manga.id'), nullable=True)
+    weight = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    starts_at = db.Column(db.DateTime, nullable=True)
+    ends_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=True, default=datetime.now, onupdate=datetime.now)
     anime = db.relationship('Anime', backref='banner')
     manga = db.relationship('Manga', backref='banner')
 
@@ -114,6 +131,8 @@ class MusicCategory(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), unique=True, nullable=False)
     songs = db.relationship('Song', backref='category', lazy=True)
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
     def __repr__(self): return self.name
 
 class Song(db.Model):
@@ -122,4 +141,22 @@ class Song(db.Model):
     artist = db.Column(db.String(100), nullable=False)
     cover_url = db.Column(db.String(100), nullable=False, default='default_cover.jpg')
     song_url = db.Column(db.String(100), nullable=False)
-    music_category_id = db.Column(db.Integer, db.ForeignKey('music_category.id'), nullable=False)
\ No newline at end of file
+    music_category_id = db.Column(db.Integer, db.ForeignKey('music_category.id'), nullable=False)
+    version_id = db.Column(db.Integer, nullable=False, server_default='1')
+    __mapper_args__ = {'version_id_col': version_id}
+
+# create_all purani tables ko alter nahi karta, isliye baad mein jode gaye columns yahan se add hote hain.
+SCHEMA_UPGRADES = {
+    model.__tablename__: [('version_id', 'INTEGER NOT NULL DEFAULT 1')]
+    for model in (Category, Anime, Episode, Manga, MangaChapter, MangaPage, MusicCategory, Song)
+}
+SCHEMA_UPGRADES[Banner.__tablename__] = [('weight', 'INTEGER NOT NULL DEFAULT 1'), ('starts_at', 'DATETIME'), ('ends_at', 'DATETIME'), ('updated_at', 'DATETIME')]
+
+def upgrade_schema():
+    inspector = inspect(db.engine)
+    for table, columns in SCHEMA_UPGRADES.items():
+        existing = {column['name'] for column in inspector.get_columns(table)}
+        for name, ddl in columns:
+            if name not in existing:
+                db.session.execute(db.text(f'ALTER TABLE {table} ADD COLUMN {name} {ddl}'))
+    db.session.commit()
\ No newline at end of file
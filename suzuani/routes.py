@@ -2,10 +2,11 @@ from flask import (Blueprint, flash, jsonify, redirect, render_template,
                    request, url_for)
 from flask_login import current_user, login_required, login_user, logout_user
 from suzuani import bcrypt, db
+from suzuani.banners import banner_service
 from suzuani.forms import (CommentForm, LoginForm, OTPForm, ProfileUpdateForm,
                            RegistrationForm, RequestResetForm,
                            ResetPasswordForm)
-from suzuani.models import (Anime, Banner, Category, Comment, Manga,
+from suzuani.models import (Anime, Category, Comment, Manga,
                             MangaChapter, User, MusicCategory, Song)
 from suzuani.utils import (generate_otp, save_picture, send_otp_email,
                            send_reset_email)
@@ -15,7 +16,7 @@ main = Blueprint('main', __name__)
 @main.route("/")
 @login_required
 def index():
-    banners = Banner.query.filter_by(banner_type='anime').limit(4).all()
+    banners = banner_service.rotation('anime')
     categories = Category.query.all()
     animes_by_category = {cat: Anime.query.filter_by(category=cat).limit(10).all() for cat in categories}
     return render_template('index.html', banners=banners, animes_by_category=animes_by_category)
@@ -23,7 +24,7 @@ def index():
 @main.route("/mangas")
 @login_required
 def mangas():
-    banners = Banner.query.filter_by(banner_type='manga').limit(4).all()
+    banners = banner_service.rotation('manga')
     categories = Category.query.all()
     mangas_by_category = {cat: Manga.query.filter_by(category=cat).limit(10).all() for cat in categories}
     return render_template('mangas.html', banners=banners, mangas_by_category=mangas_by_category)
@@ -31,7 +32,7 @@ def mangas():
 @main.route("/music")
 @login_required
 def music():
-    banners = Banner.query.filter_by(banner_type='music').limit(4).all()
+    banners = banner_service.rotation('music')
     music_categories = MusicCategory.query.all()
     songs_by_category = {cat: Song.query.filter_by(category=cat).limit(15).all() for cat in music_categories}
     return render_template('music.html', songs_by_category=songs_by_category, banners=banners)
@@ -1,6 +1,6 @@
 import os
 import secrets
-from PIL import Image
+from PIL import Image, ImageOps
 from flask import url_for, current_app, render_template
 from flask_mail import Message
 from suzuani import mail
@@ -16,6 +16,25 @@ def save_picture(form_picture, path, output_size=(500, 500)):
     i.save(picture_path)
     return picture_fn
 
+def banner_variant_path(image_url, width):
+    stem, _ = os.path.splitext(image_url)
+    return f'{stem}_{width}w.webp'
+
+def save_banner_variants(image_url):
+    # Har device width ke liye banner ka crop WebP mein, taaki page sabse chhoti fitting image bheje.
+    static_path = os.path.join(current_app.root_path, 'static')
+    with Image.open(os.path.join(static_path, image_url)) as i:
+        i = i.convert('RGBA' if i.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        for size in current_app.config['BANNER_SIZES']:
+            crop = ImageOps.fit(i, size, Image.Resampling.LANCZOS)
+            crop.save(os.path.join(static_path, banner_variant_path(image_url, size[0])), 'WEBP', quality=80, method=4)
+
+def delete_banner_variants(image_url):
+    static_path = os.path.join(current_app.root_path, 'static')
+    for width, _ in current_app.config['BANNER_SIZES']:
+        variant = os.path.join(static_path, banner_variant_path(image_url, width))
+        if os.path.exists(variant): os.remove(variant)
+
 def generate_otp():
     return str(secrets.randbelow(900000) + 100000)
 